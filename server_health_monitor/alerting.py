@@ -0,0 +1,319 @@
+"""
+Alerting module - Check thresholds and send alerts
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import logging
+import queue
+import threading
+import time
+from collections import defaultdict, deque
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; batch checks fall back to a loop
+    np = None
+
+from server_health_monitor.config.config import config
+from server_health_monitor.timestamps import local_time
+
+logger = logging.getLogger(__name__)
+
+# Seconds the Slack worker waits to collect more alerts into one post
+SLACK_BATCH_WINDOW = 2.0
+# Maximum Slack posts per rolling minute
+SLACK_MAX_PER_MINUTE = 20
+# Seconds close() waits for queued alerts to be posted
+SLACK_CLOSE_TIMEOUT = 10.0
+
+# Queued by close() to tell the Slack worker to flush and exit
+_STOP = None
+
+# (metric key, alert type, label, warning, critical)
+_THRESHOLDS = (
+    ('cpu_usage', 'cpu_high', 'CPU', config.CPU_WARNING, config.CPU_CRITICAL),
+    ('memory_usage', 'memory_high', 'Memory',
+     config.MEMORY_WARNING, config.MEMORY_CRITICAL),
+    ('disk_usage', 'disk_high', 'Disk', config.DISK_WARNING, config.DISK_CRITICAL),
+)
+
+
+def _threshold_alerts(metrics: Dict) -> List[Dict]:
+    """Alerts for every threshold the metrics currently cross"""
+    alerts = []
+    
+    for key, alert_type, label, warning, critical in _THRESHOLDS:
+        value = metrics.get(key, 0)
+        if value >= critical:
+            severity = 'critical'
+        elif value >= warning:
+            severity = 'warning'
+        else:
+            continue
+        
+        alerts.append({
+            'type': alert_type,
+            'severity': severity,
+            'message': f'{label} usage {severity}: {value}%'
+        })
+    
+    return alerts
+
+
+class AlertManager:
+    """Manages alerts and notifications"""
+    
+    def __init__(self):
+        self.slack_webhook = config.SLACK_WEBHOOK_URL
+        self._session = self._create_session()
+        self._queue = queue.Queue()
+        self._sent_times: deque = deque()
+        self._streak: Dict[str, int] = defaultdict(int)
+        self._last_alerted: Dict[Tuple[str, str], float] = {}
+        self._worker: Optional[threading.Thread] = None
+        
+        if self.slack_webhook:
+            self._worker = threading.Thread(
+                target=self._slack_worker,
+                name='slack-sender',
+                daemon=True
+            )
+            self._worker.start()
+    
+    def close(self, timeout: float = SLACK_CLOSE_TIMEOUT):
+        """Post any queued alerts and stop the Slack worker"""
+        worker, self._worker = self._worker, None
+        if worker is None:
+            return
+        
+        self._queue.put(_STOP)
+        worker.join(timeout)
+        if worker.is_alive():
+            logger.warning(f"Slack sender did not finish within {timeout}s")
+    
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """Create a keep-alive HTTP session with retries for Slack"""
+        retry = Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset(['POST'])
+        )
+        session = requests.Session()
+        session.mount('https://', HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=2,
+            max_retries=retry
+        ))
+        return session
+    
+    def _should_alert(self, key: str, severity: Optional[str]) -> bool:
+        """Track a condition and decide whether its alert fires now
+        
+        severity is None when the condition is not breached. An alert fires
+        once the breach has held for ALERT_SUSTAIN_CHECKS consecutive checks,
+        and not again at the same severity within ALERT_COOLDOWN seconds.
+        """
+        if severity is None:
+            self._streak[key] = 0
+            return False
+        
+        self._streak[key] += 1
+        if self._streak[key] < config.ALERT_SUSTAIN_CHECKS:
+            return False
+        
+        now = time.monotonic()
+        last = self._last_alerted.get((key, severity))
+        if last is not None and now - last < config.ALERT_COOLDOWN:
+            return False
+        
+        self._last_alerted[(key, severity)] = now
+        return True
+    
+    def check_thresholds(self, metrics: Dict) -> List[Dict]:
+        """Check metrics against thresholds, suppressing repeats"""
+        breached = {alert['type']: alert for alert in _threshold_alerts(metrics)}
+        alerts = []
+        
+        for _, alert_type, _, _, _ in _THRESHOLDS:
+            alert = breached.get(alert_type)
+            if self._should_alert(alert_type, alert and alert['severity']):
+                alerts.append(alert)
+        
+        return alerts
+    
+    def check_thresholds_batch(self, metrics_list: List[Dict]) -> List[List[Dict]]:
+        """Check many servers' metrics at once; one alert list per input"""
+        if np is None:
+            return [_threshold_alerts(m) for m in metrics_list]
+        
+        results: List[List[Dict]] = [[] for _ in metrics_list]
+        for key, alert_type, label, warning, critical in _THRESHOLDS:
+            values = np.fromiter(
+                (m.get(key, 0) for m in metrics_list),
+                dtype=np.float64,
+                count=len(metrics_list)
+            )
+            levels = np.select([values >= critical, values >= warning], [2, 1], 0)
+            
+            for i in np.flatnonzero(levels):
+                severity = 'critical' if levels[i] == 2 else 'warning'
+                results[i].append({
+                    'type': alert_type,
+                    'severity': severity,
+                    'message': f'{label} usage {severity}: {metrics_list[i].get(key, 0)}%'
+                })
+        
+        return results
+    
+    def check_services(self, services: Dict[str, str]) -> List[Dict]:
+        """Check service status"""
+        alerts = []
+        
+        for service, status in services.items():
+            severity = 'critical' if status != 'active' else None
+            if self._should_alert(f'service:{service}', severity):
+                alerts.append({
+                    'type': 'service_down',
+                    'severity': 'critical',
+                    'message': f'Service {service} is {status}'
+                })
+        
+        return alerts
+    
+    def send_slack_alert(self, alert: Dict, hostname: str) -> bool:
+        """Queue alert for the background Slack sender
+        
+        Returns True once the alert is queued, not when Slack accepts it;
+        delivery failures are logged by the sender.
+        """
+        if not self.slack_webhook:
+            logger.debug("Slack webhook not configured")
+            return False
+        if self._worker is None:
+            logger.warning("Slack sender closed; alert not sent")
+            return False
+        
+        self._queue.put((alert, hostname))
+        return True
+    
+    def _slack_worker(self):
+        """Drain queued alerts and post them to Slack in batches"""
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is _STOP:
+                break
+            batch = [item]
+            deadline = time.monotonic() + SLACK_BATCH_WINDOW
+            
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    # Post what is already queued without waiting out the window
+                    stopping = True
+                    break
+                batch.append(item)
+            
+            self._wait_for_rate_limit()
+            self._post_slack(self._build_slack_message(batch))
+    
+    def _wait_for_rate_limit(self):
+        """Block until another Slack post fits in the per-minute budget"""
+        now = time.monotonic()
+        while self._sent_times and now - self._sent_times[0] >= 60:
+            self._sent_times.popleft()
+        
+        if len(self._sent_times) >= SLACK_MAX_PER_MINUTE:
+            time.sleep(60 - (now - self._sent_times[0]))
+            self._sent_times.popleft()
+        
+        self._sent_times.append(time.monotonic())
+    
+    def _build_slack_message(self, batch: List[Tuple[Dict, str]]) -> Dict:
+        """Merge alerts into one Slack payload, one attachment per host/severity"""
+        groups: Dict[Tuple[str, str], List[str]] = {}
+        for alert, hostname in batch:
+            groups.setdefault((hostname, alert['severity']), []).append(
+                alert['message']
+            )
+        
+        footer = f"Time: {local_time()}"
+        attachments = []
+        for (hostname, severity), messages in groups.items():
+            emoji = '🚨' if severity == 'critical' else '⚠️'
+            color = '#FF0000' if severity == 'critical' else '#FFA500'
+            
+            attachments.append({
+                "color": color,
+                "title": f"{emoji} Server Alert",
+                "fields": [
+                    {"title": "Server", "value": hostname, "short": True},
+                    {"title": "Severity", "value": severity, "short": True},
+                    {"title": "Message", "value": "\n".join(messages), "short": False}
+                ],
+                "footer": footer
+            })
+        
+        return {"attachments": attachments}
+    
+    def _post_slack(self, message: Dict) -> bool:
+        """Send a prepared payload to Slack"""
+        try:
+            response = self._session.post(
+                self.slack_webhook, json=message, timeout=10
+            )
+            
+            if response.status_code == 200:
+                logger.info(
+                    f"Slack alert sent: {len(message['attachments'])} group(s)"
+                )
+                return True
+            
+        except Exception as e:
+            logger.error(f"Slack error: {e}")
+        
+        return False
+    
+    def send_alert(self, alert: Dict, hostname: str):
+        """Send alert through all channels"""
+        # Console output
+        severity_icon = "🚨" if alert['severity'] == 'critical' else "⚠️"
+        print(f"\n{severity_icon} ALERT: {alert['message']}")
+        
+        # Slack
+        self.send_slack_alert(alert, hostname)
+
+
+# Test
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.DEBUG)
+    
+    alert_manager = AlertManager()
+    
+    # Test with high values
+    test_metrics = {
+        'cpu_usage': 85,
+        'memory_usage': 92,
+        'disk_usage': 70
+    }
+    
+    # Alerts fire once the breach is sustained
+    for _ in range(config.ALERT_SUSTAIN_CHECKS):
+        alerts = alert_manager.check_thresholds(test_metrics)
+    
+    print("Generated Alerts:")
+    for alert in alerts:
+        print(f"  [{alert['severity']}] {alert['message']}")
+    
+    print("\n✅ Alerting test passed!")
\ No newline at end of file
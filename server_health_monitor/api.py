@@ -0,0 +1,282 @@
+"""
+REST API for Server Health Monitor
+"""
+
+from flask import Flask, Response, jsonify, request, make_response
+from flask_cors import CORS
+from functools import wraps
+from typing import Optional
+import logging
+import threading
+import time
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to Flask's encoder
+    orjson = None
+
+from server_health_monitor.config.config import config
+from server_health_monitor.database import Database
+from server_health_monitor.metrics_collector import MetricsCollector
+from server_health_monitor.timestamps import utc_iso
+
+# Initialize Flask
+app = Flask(__name__)
+CORS(app)
+
+logger = logging.getLogger(__name__)
+
+
+# Components are created on first use, not at import. waitress serves
+# requests on several threads, so creation is locked to build each once.
+_components_lock = threading.Lock()
+_DB: Optional[Database] = None
+_COLLECTOR: Optional[MetricsCollector] = None
+
+
+def _db() -> Database:
+    """Shared Database instance"""
+    global _DB
+    if _DB is None:
+        with _components_lock:
+            if _DB is None:
+                _DB = Database()
+    return _DB
+
+
+def _collector() -> MetricsCollector:
+    """Shared MetricsCollector instance"""
+    global _COLLECTOR
+    if _COLLECTOR is None:
+        with _components_lock:
+            if _COLLECTOR is None:
+                _COLLECTOR = MetricsCollector()
+    return _COLLECTOR
+
+
+# Seconds a cached read-only response stays fresh
+API_CACHE_TTL = 5
+
+
+def ojsonify(obj) -> Response:
+    """Like jsonify, but encodes with orjson when available"""
+    if orjson is None:
+        return jsonify(obj)
+    return Response(orjson.dumps(obj), mimetype='application/json')
+
+
+def ttl_cache(seconds: float):
+    """Cache successful JSON responses per route and path args
+    
+    Wrapped routes must not read query arguments; the key ignores them so
+    clients cannot grow the cache with arbitrary query strings.
+    """
+    def decorator(fn):
+        cache = {}
+        
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            key = tuple(sorted(kwargs.items()))
+            now = time.monotonic()
+            
+            cached = cache.get(key)
+            if cached and cached[0] > now:
+                return app.response_class(cached[1], mimetype=cached[2])
+            
+            response = make_response(fn(*args, **kwargs))
+            if response.status_code == 200:
+                for stale in [k for k, v in cache.items() if v[0] <= now]:
+                    del cache[stale]
+                cache[key] = (now + seconds, response.get_data(), response.mimetype)
+            return response
+        
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    return decorator
+
+
+# ============ API ROUTES ============
+
+@app.route('/')
+def home():
+    """API Home"""
+    return jsonify({
+        'name': 'Server Health Monitor API',
+        'version': '1.0.0',
+        'status': 'running',
+        'endpoints': {
+            'GET /': 'This message',
+            'GET /health': 'Health check',
+            'GET /api/metrics': 'Current metrics',
+            'GET /api/metrics/history/<type>': 'Metric history',
+            'GET /api/servers': 'List servers',
+            'GET /api/alerts': 'Unresolved alerts',
+            'POST /api/alerts/<id>/resolve': 'Resolve alert',
+            'GET /api/dashboard': 'Dashboard data'
+        }
+    })
+
+
+@app.route('/health')
+def health():
+    """Health check endpoint"""
+    return jsonify({
+        'status': 'healthy',
+        'timestamp': utc_iso()
+    })
+
+
+@app.route('/api/metrics')
+@ttl_cache(API_CACHE_TTL)
+def get_metrics():
+    """Get current server metrics"""
+    try:
+        metrics = _collector().collect_all()
+        return jsonify({
+            'success': True,
+            'data': metrics.to_dict()
+        })
+    except Exception as e:
+        logger.error(f"Error: {e}")
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
+@app.route('/api/metrics/history/<metric_type>')
+def get_metric_history(metric_type):
+    """Get historical data for a metric"""
+    try:
+        hours = request.args.get('hours', 24, type=int)
+        server_id = request.args.get('server_id', 1, type=int)
+        # 0 returns raw samples; negative sizes mean the same
+        bucket = max(request.args.get('bucket', 300, type=int), 0)
+        
+        history = _db().get_metric_history(server_id, metric_type, hours, bucket)
+        
+        return ojsonify({
+            'success': True,
+            'data': {
+                'metric_type': metric_type,
+                'hours': hours,
+                'bucket': bucket,
+                'history': history
+            }
+        })
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
+@app.route('/api/servers')
+@ttl_cache(API_CACHE_TTL)
+def get_servers():
+    """Get all servers"""
+    try:
+        servers = _db().get_all_servers()
+        return jsonify({
+            'success': True,
+            'data': servers
+        })
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
+@app.route('/api/alerts')
+def get_alerts():
+    """Get unresolved alerts"""
+    try:
+        alerts = _db().get_unresolved_alerts()
+        return jsonify({
+            'success': True,
+            'data': alerts,
+            'count': len(alerts)
+        })
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
+@app.route('/api/alerts/<int:alert_id>/resolve', methods=['POST'])
+def resolve_alert(alert_id):
+    """Resolve an alert"""
+    try:
+        _db().resolve_alert(alert_id)
+        # The dashboard's alert counts must reflect the resolve right away
+        get_dashboard.cache_clear()
+        return jsonify({
+            'success': True,
+            'message': f'Alert {alert_id} resolved'
+        })
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
+@app.route('/api/dashboard')
+@ttl_cache(API_CACHE_TTL)
+def get_dashboard():
+    """Get dashboard summary"""
+    try:
+        summary = _db().get_dashboard_summary()
+        current = _collector().collect_all()
+        alerts = _db().get_recent_alerts(5)
+        
+        return ojsonify({
+            'success': True,
+            'data': {
+                'summary': summary,
+                'current_metrics': current.metrics_dict(),
+                'recent_alerts': alerts,
+                'timestamp': current.timestamp
+            }
+        })
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
+@app.route('/api/services')
+@ttl_cache(API_CACHE_TTL)
+def get_services():
+    """Get service status"""
+    try:
+        services = _collector().check_services(config.SERVICES_TO_MONITOR)
+        return jsonify({
+            'success': True,
+            'data': services
+        })
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
+# Error handlers
+@app.errorhandler(404)
+def not_found(e):
+    return jsonify({'success': False, 'error': 'Not found'}), 404
+
+
+@app.errorhandler(500)
+def server_error(e):
+    return jsonify({'success': False, 'error': 'Server error'}), 500
+
+
+# Run
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.DEBUG)
+    logging.getLogger('werkzeug').setLevel(logging.WARNING)
+    print("\n🚀 Starting Server Health Monitor API...")
+    print(f"📡 API running at: http://localhost:{config.API_PORT}")
+    print("📋 Endpoints: http://localhost:5000/")
+    print("\nPress Ctrl+C to stop\n")
+    
+    try:
+        from waitress import serve
+    except ImportError:
+        # Development server fallback
+        app.run(
+            host=config.API_HOST,
+            port=config.API_PORT,
+            debug=config.API_DEBUG
+        )
+    else:
+        serve(
+            app,
+            host=config.API_HOST,
+            port=config.API_PORT,
+            threads=config.API_THREADS
+        )
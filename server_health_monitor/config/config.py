@@ -0,0 +1,124 @@
+"""
+Configuration settings for Server Health Monitor
+"""
+
+import os
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+
+def _env_str(name: str, default: str) -> str:
+    """Read a string setting from the environment"""
+    return os.environ.get(name, default)
+
+
+def _env_float(name: str, default: float) -> float:
+    """Read a float setting from the environment"""
+    return float(os.environ.get(name, default))
+
+
+def _env_int(name: str, default: int) -> int:
+    """Read an int setting from the environment"""
+    return int(os.environ.get(name, default))
+
+
+def _env_tuple(name: str, default: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Read a comma-separated list setting from the environment"""
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return tuple(item.strip() for item in value.split(',') if item.strip())
+
+
+@dataclass(frozen=True)
+class Config:
+    """Application configuration (read once from the environment)"""
+
+    __slots__ = (
+        'DB_PATH', 'SQLITE_POOL_SIZE',
+        'CPU_WARNING', 'CPU_CRITICAL',
+        'MEMORY_WARNING', 'MEMORY_CRITICAL',
+        'DISK_WARNING', 'DISK_CRITICAL',
+        'ALERT_SUSTAIN_CHECKS', 'ALERT_COOLDOWN',
+        'CHECK_INTERVAL',
+        'SERVICES_TO_MONITOR',
+        'SLACK_WEBHOOK_URL',
+        'API_HOST', 'API_PORT', 'API_DEBUG', 'API_THREADS',
+        'LOG_LEVEL', 'LOG_FILE',
+    )
+
+    # Database (using SQLite for simplicity)
+    DB_PATH: str
+    SQLITE_POOL_SIZE: int
+
+    # Alert Thresholds
+    CPU_WARNING: float
+    CPU_CRITICAL: float
+    MEMORY_WARNING: float
+    MEMORY_CRITICAL: float
+    DISK_WARNING: float
+    DISK_CRITICAL: float
+
+    # Alert suppression: consecutive breaching checks before alerting,
+    # and seconds before the same alert may fire again
+    ALERT_SUSTAIN_CHECKS: int
+    ALERT_COOLDOWN: float
+
+    # Monitoring interval (seconds)
+    CHECK_INTERVAL: int
+
+    # Services to monitor
+    SERVICES_TO_MONITOR: Tuple[str, ...]
+
+    # Slack Configuration
+    SLACK_WEBHOOK_URL: str
+
+    # API Configuration
+    API_HOST: str
+    API_PORT: int
+    API_DEBUG: bool
+    API_THREADS: int
+
+    # Logging
+    LOG_LEVEL: str
+    LOG_FILE: str
+
+    @classmethod
+    def from_env(cls) -> 'Config':
+        """Build configuration from environment variables"""
+        return cls(
+            DB_PATH=_env_str('DB_PATH', 'monitoring.db'),
+            SQLITE_POOL_SIZE=_env_int('SQLITE_POOL_SIZE', 5),
+            CPU_WARNING=_env_float('CPU_WARNING', 70),
+            CPU_CRITICAL=_env_float('CPU_CRITICAL', 90),
+            MEMORY_WARNING=_env_float('MEMORY_WARNING', 75),
+            MEMORY_CRITICAL=_env_float('MEMORY_CRITICAL', 90),
+            DISK_WARNING=_env_float('DISK_WARNING', 80),
+            DISK_CRITICAL=_env_float('DISK_CRITICAL', 95),
+            ALERT_SUSTAIN_CHECKS=_env_int('ALERT_SUSTAIN_CHECKS', 2),
+            ALERT_COOLDOWN=_env_float('ALERT_COOLDOWN', 900),
+            CHECK_INTERVAL=_env_int('CHECK_INTERVAL', 60),
+            SERVICES_TO_MONITOR=_env_tuple('SERVICES_TO_MONITOR', ('ssh', 'cron')),
+            SLACK_WEBHOOK_URL=_env_str('SLACK_WEBHOOK_URL', ''),
+            API_HOST=_env_str('API_HOST', '0.0.0.0'),
+            API_PORT=_env_int('API_PORT', 5000),
+            API_DEBUG=_env_str('API_DEBUG', 'true').lower() == 'true',
+            API_THREADS=_env_int('API_THREADS', 8),
+            LOG_LEVEL=_env_str('LOG_LEVEL', 'INFO'),
+            LOG_FILE=_env_str('LOG_FILE', 'logs/app.log'),
+        )
+
+
+_CONFIG: Optional[Config] = None
+
+
+def get_config() -> Config:
+    """Return the shared configuration, building it on first call"""
+    global _CONFIG
+    if _CONFIG is None:
+        _CONFIG = Config.from_env()
+    return _CONFIG
+
+
+# Create instance
+config = get_config()
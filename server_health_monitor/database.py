@@ -0,0 +1,408 @@
+"""
+Database operations for Server Health Monitor
+Uses SQLite for simplicity
+"""
+
+import sqlite3
+import logging
+import queue
+import time
+from datetime import datetime
+from typing import List, Dict, Optional, Tuple
+from contextlib import contextmanager
+
+from server_health_monitor.config.config import config
+
+logger = logging.getLogger(__name__)
+
+# Seconds a cached dashboard summary stays fresh
+SUMMARY_TTL = 5
+
+# Prepared statements kept per connection by the sqlite3 module
+STATEMENT_CACHE_SIZE = 256
+
+# ========== SQL STATEMENTS ==========
+
+_SQL_SERVER_ID = 'SELECT id FROM servers WHERE hostname = ?'
+
+_SQL_INSERT_SERVER = 'INSERT INTO servers (hostname, ip_address) VALUES (?, ?)'
+
+_SQL_ALL_SERVERS = 'SELECT * FROM servers'
+
+_SQL_INSERT_METRIC = '''
+    INSERT INTO metrics (server_id, metric_type, metric_value)
+    VALUES (?, ?, ?)
+'''
+
+# One row per metric type: the most recent sample
+_SQL_LATEST_METRICS = '''
+    SELECT metric_type, metric_value, collected_at
+    FROM (
+        SELECT metric_type, metric_value, collected_at,
+               ROW_NUMBER() OVER (
+                   PARTITION BY metric_type
+                   ORDER BY collected_at DESC, id DESC
+               ) AS rn
+        FROM metrics
+        WHERE server_id = ?
+    )
+    WHERE rn = 1
+'''
+
+_SQL_HISTORY = '''
+    SELECT metric_value, collected_at
+    FROM metrics
+    WHERE server_id = ?
+    AND metric_type = ?
+    AND collected_at >= datetime('now', ?)
+    ORDER BY collected_at ASC
+'''
+
+_SQL_HISTORY_BUCKETED = '''
+    SELECT AVG(metric_value) AS metric_value,
+           MIN(collected_at) AS collected_at
+    FROM metrics
+    WHERE server_id = ?
+    AND metric_type = ?
+    AND collected_at >= datetime('now', ?)
+    GROUP BY CAST(strftime('%s', collected_at) AS INTEGER) / ?
+    ORDER BY collected_at ASC
+'''
+
+_SQL_INSERT_ALERT = '''
+    INSERT INTO alerts (server_id, alert_type, severity, message)
+    VALUES (?, ?, ?, ?)
+'''
+
+_SQL_UNRESOLVED_ALERTS = '''
+    SELECT a.*, s.hostname
+    FROM alerts a INDEXED BY idx_alerts_unresolved
+    JOIN servers s ON a.server_id = s.id
+    WHERE a.is_resolved = 0
+    ORDER BY a.created_at DESC, a.id DESC
+'''
+
+_SQL_RECENT_ALERTS = _SQL_UNRESOLVED_ALERTS + '    LIMIT ?\n'
+
+_SQL_RESOLVE_ALERT = '''
+    UPDATE alerts
+    SET is_resolved = 1, resolved_at = CURRENT_TIMESTAMP
+    WHERE id = ?
+'''
+
+_SQL_COUNT_SERVERS = 'SELECT COUNT(*) as count FROM servers'
+
+_SQL_COUNT_UNRESOLVED = 'SELECT COUNT(*) as count FROM alerts WHERE is_resolved = 0'
+
+
+class _ConnectionPool:
+    """Fixed-size pool of reusable SQLite connections"""
+    
+    def __init__(self, db_path: str, pool_size: int):
+        """Open pool_size connections up front"""
+        self._pool = queue.Queue(maxsize=pool_size)
+        for _ in range(pool_size):
+            self._pool.put(self._connect(db_path))
+    
+    @staticmethod
+    def _connect(db_path: str) -> sqlite3.Connection:
+        """Open and configure a single connection"""
+        conn = sqlite3.connect(
+            db_path,
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=STATEMENT_CACHE_SIZE
+        )
+        conn.row_factory = sqlite3.Row
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA cache_size=-8000')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        return conn
+    
+    def get(self) -> sqlite3.Connection:
+        """Borrow a connection, blocking until one is free"""
+        return self._pool.get()
+    
+    def put(self, conn: sqlite3.Connection):
+        """Return a borrowed connection"""
+        self._pool.put(conn)
+
+
+class Database:
+    """SQLite Database Handler"""
+    
+    def __init__(self, db_path: str = None):
+        """Initialize database"""
+        self.db_path = db_path or config.DB_PATH
+        self._pool = _ConnectionPool(self.db_path, config.SQLITE_POOL_SIZE)
+        self._summary_cache: Optional[Tuple[float, Dict]] = None
+        self._hostname_ids: Dict[str, int] = {}
+        self._create_tables()
+    
+    @contextmanager
+    def _get_connection(self):
+        """Get database connection from the pool"""
+        conn = self._pool.get()
+        try:
+            yield conn
+        finally:
+            self._pool.put(conn)
+    
+    def _create_tables(self):
+        """Create database tables"""
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            
+            # Servers table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS servers (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    hostname TEXT UNIQUE NOT NULL,
+                    ip_address TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            
+            # Metrics table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS metrics (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    server_id INTEGER NOT NULL,
+                    metric_type TEXT NOT NULL,
+                    metric_value REAL NOT NULL,
+                    collected_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    FOREIGN KEY (server_id) REFERENCES servers(id)
+                )
+            ''')
+            
+            # Create index for faster queries
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_metrics_server 
+                ON metrics(server_id, collected_at)
+            ''')
+            
+            # Covering index for latest-value-per-type lookups
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_metrics_type_time
+                ON metrics(server_id, metric_type, collected_at DESC)
+            ''')
+            
+            # Alerts table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS alerts (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    server_id INTEGER NOT NULL,
+                    alert_type TEXT NOT NULL,
+                    severity TEXT NOT NULL,
+                    message TEXT,
+                    is_resolved INTEGER DEFAULT 0,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    resolved_at TIMESTAMP,
+                    FOREIGN KEY (server_id) REFERENCES servers(id)
+                )
+            ''')
+            
+            # Partial index holding only unresolved alerts
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_alerts_unresolved
+                ON alerts(created_at DESC) WHERE is_resolved = 0
+            ''')
+            
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_alerts_server
+                ON alerts(server_id)
+            ''')
+            
+            conn.commit()
+            logger.info("Database tables created successfully")
+    
+    # ========== SERVER OPERATIONS ==========
+    
+    def add_server(self, hostname: str, ip_address: str = None) -> int:
+        """Add server or return existing ID"""
+        server_id = self._hostname_ids.get(hostname)
+        if server_id is not None:
+            return server_id
+        
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            
+            # Check if exists
+            cursor.execute(_SQL_SERVER_ID, (hostname,))
+            row = cursor.fetchone()
+            
+            if row:
+                server_id = row['id']
+            else:
+                # Insert new
+                cursor.execute(_SQL_INSERT_SERVER, (hostname, ip_address))
+                conn.commit()
+                self._summary_cache = None
+                server_id = cursor.lastrowid
+            
+            self._hostname_ids[hostname] = server_id
+            return server_id
+    
+    def get_all_servers(self) -> List[Dict]:
+        """Get all servers"""
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(_SQL_ALL_SERVERS)
+            return [dict(row) for row in cursor.fetchall()]
+    
+    # ========== METRICS OPERATIONS ==========
+    
+    def save_metrics(self, server_id: int, metrics: Dict[str, float]):
+        """Save multiple metrics"""
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            
+            # One transaction for the whole batch
+            cursor.execute('BEGIN')
+            try:
+                cursor.executemany(
+                    _SQL_INSERT_METRIC,
+                    [(server_id, k, v) for k, v in metrics.items()]
+                )
+                cursor.execute('COMMIT')
+            except Exception:
+                cursor.execute('ROLLBACK')
+                raise
+            
+            logger.debug(f"Saved {len(metrics)} metrics for server {server_id}")
+    
+    def get_latest_metrics(self, server_id: int) -> Dict:
+        """Get latest metrics for a server"""
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute(_SQL_LATEST_METRICS, (server_id,))
+            
+            result = {
+                row['metric_type']: {
+                    'value': row['metric_value'],
+                    'collected_at': row['collected_at']
+                }
+                for row in cursor.fetchall()
+            }
+            
+            return result
+    
+    def get_metric_history(self, server_id: int, metric_type: str, 
+                          hours: int = 24, bucket_seconds: int = 0) -> List[Dict]:
+        """Get metric history, averaged per bucket_seconds when given"""
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            
+            if bucket_seconds > 0:
+                cursor.execute(
+                    _SQL_HISTORY_BUCKETED,
+                    (server_id, metric_type, f'-{hours} hours', bucket_seconds)
+                )
+            else:
+                cursor.execute(
+                    _SQL_HISTORY,
+                    (server_id, metric_type, f'-{hours} hours')
+                )
+            
+            return [dict(row) for row in cursor.fetchall()]
+    
+    # ========== ALERT OPERATIONS ==========
+    
+    def create_alert(self, server_id: int, alert_type: str, 
+                    severity: str, message: str) -> int:
+        """Create new alert"""
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute(
+                _SQL_INSERT_ALERT,
+                (server_id, alert_type, severity, message)
+            )
+            
+            conn.commit()
+            self._summary_cache = None
+            logger.warning(f"Alert created: {severity} - {message}")
+            return cursor.lastrowid
+    
+    def get_unresolved_alerts(self) -> List[Dict]:
+        """Get all unresolved alerts"""
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute(_SQL_UNRESOLVED_ALERTS)
+            
+            return [dict(row) for row in cursor.fetchall()]
+    
+    def get_recent_alerts(self, limit: int = 5) -> List[Dict]:
+        """Get the newest unresolved alerts"""
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(_SQL_RECENT_ALERTS, (limit,))
+            return [dict(row) for row in cursor.fetchall()]
+    
+    def resolve_alert(self, alert_id: int):
+        """Mark alert as resolved"""
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute(_SQL_RESOLVE_ALERT, (alert_id,))
+            
+            conn.commit()
+            self._summary_cache = None
+    
+    # ========== DASHBOARD ==========
+    
+    def get_dashboard_summary(self) -> Dict:
+        """Get dashboard summary (cached for SUMMARY_TTL seconds)"""
+        cached = self._summary_cache
+        if cached and cached[0] > time.monotonic():
+            return dict(cached[1])
+        
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            
+            # Server count
+            cursor.execute(_SQL_COUNT_SERVERS)
+            server_count = cursor.fetchone()['count']
+            
+            # Unresolved alerts
+            cursor.execute(_SQL_COUNT_UNRESOLVED)
+            alert_count = cursor.fetchone()['count']
+            
+            summary = {
+                'total_servers': server_count,
+                'unresolved_alerts': alert_count
+            }
+            self._summary_cache = (time.monotonic() + SUMMARY_TTL, summary)
+            return dict(summary)
+
+
+# Test the database
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.DEBUG)
+    
+    # Create database instance
+    db = Database('test.db')
+    
+    # Add a server
+    server_id = db.add_server('localhost', '127.0.0.1')
+    print(f"Server ID: {server_id}")
+    
+    # Save metrics
+    db.save_metrics(server_id, {
+        'cpu_usage': 45.5,
+        'memory_usage': 62.3,
+        'disk_usage': 55.0
+    })
+    
+    # Get metrics
+    metrics = db.get_latest_metrics(server_id)
+    print(f"Metrics: {metrics}")
+    
+    # Get summary
+    summary = db.get_dashboard_summary()
+    print(f"Summary: {summary}")
+    
+    print("✅ Database test passed!")
\ No newline at end of file
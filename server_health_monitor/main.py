@@ -2,19 +2,16 @@
 Main application - Server Health Monitor
 """
 
-import time
 import logging
 import signal
+import threading
 import sys
 import os
 
-# Add parent directory
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from config.config import config
-from src.database import Database
-from src.metrics_collector import MetricsCollector
-from src.alerting import AlertManager
+from server_health_monitor.config.config import config
+from server_health_monitor.database import Database
+from server_health_monitor.metrics_collector import MetricsCollector
+from server_health_monitor.alerting import AlertManager
 
 # Setup logging
 os.makedirs('logs', exist_ok=True)
@@ -33,42 +30,44 @@ db = Database()
 collector = MetricsCollector()
 alert_manager = AlertManager()
 
-# Flag for graceful shutdown
-running = True
+# Console report, formatted in one pass per iteration
+_METRICS_TEMPLATE = (
+    "\n" + "=" * 50 + "\n"
+    "🖥️  Server: {m.hostname}\n"
+    "📅 Time: {m.timestamp}\n"
+    + "-" * 50 + "\n"
+    "💻 CPU Usage:    {m.cpu_usage:.1f}%\n"
+    "🧠 Memory Usage: {m.memory_usage:.1f}%\n"
+    "💾 Disk Usage:   {m.disk_usage:.1f}%\n"
+    "📊 Load Average: {m.load_average[load_1min]}\n"
+    "⏱️  Uptime:       {m.uptime}\n"
+    + "=" * 50 + "\n"
+)
+
+# Set to request a graceful shutdown; also wakes the sleeping loop
+_stop = threading.Event()
 
 
 def signal_handler(sig, frame):
     """Handle shutdown"""
-    global running
     logger.info("Shutting down...")
-    running = False
+    _stop.set()
 
 
 def print_metrics(metrics):
     """Print metrics to console"""
-    print("\n" + "=" * 50)
-    print(f"🖥️  Server: {metrics['hostname']}")
-    print(f"📅 Time: {metrics['timestamp']}")
-    print("-" * 50)
-    print(f"💻 CPU Usage:    {metrics['metrics']['cpu_usage']:.1f}%")
-    print(f"🧠 Memory Usage: {metrics['metrics']['memory_usage']:.1f}%")
-    print(f"💾 Disk Usage:   {metrics['metrics']['disk_usage']:.1f}%")
-    print(f"📊 Load Average: {metrics['metrics']['load_average']['load_1min']}")
-    print(f"⏱️  Uptime:       {metrics['metrics']['uptime']}")
-    print("=" * 50)
+    sys.stdout.write(_METRICS_TEMPLATE.format(m=metrics))
 
 
 def monitoring_loop():
     """Main monitoring loop"""
-    global running
-    
     # Register signal handlers
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
     
     iteration = 0
     
-    while running:
+    while not _stop.is_set():
         iteration += 1
         logger.info(f"Monitoring iteration #{iteration}")
         
@@ -81,19 +80,20 @@ def monitoring_loop():
             
             # Add server to database
             server_id = db.add_server(
-                metrics['hostname'],
-                metrics['ip_address']
+                metrics.hostname,
+                metrics.ip_address
             )
             
             # Save metrics
-            db.save_metrics(server_id, {
-                'cpu_usage': metrics['metrics']['cpu_usage'],
-                'memory_usage': metrics['metrics']['memory_usage'],
-                'disk_usage': metrics['metrics']['disk_usage']
-            })
+            usage = {
+                'cpu_usage': metrics.cpu_usage,
+                'memory_usage': metrics.memory_usage,
+                'disk_usage': metrics.disk_usage
+            }
+            db.save_metrics(server_id, usage)
             
             # Check thresholds
-            alerts = alert_manager.check_thresholds(metrics['metrics'])
+            alerts = alert_manager.check_thresholds(usage)
             
             # Check services
             services = collector.check_services(config.SERVICES_TO_MONITOR)
@@ -108,7 +108,7 @@ def monitoring_loop():
                     alert['severity'],
                     alert['message']
                 )
-                alert_manager.send_alert(alert, metrics['hostname'])
+                alert_manager.send_alert(alert, metrics.hostname)
             
             # Status
             if alerts:
@@ -120,11 +120,15 @@ def monitoring_loop():
             logger.error(f"Error in monitoring loop: {e}")
         
         # Wait for next check
-        if running:
-            print(f"\n⏳ Next check in {config.CHECK_INTERVAL} seconds...")
-            print("   Press Ctrl+C to stop")
-            time.sleep(config.CHECK_INTERVAL)
+        if _stop.is_set():
+            break
+        print(f"\n⏳ Next check in {config.CHECK_INTERVAL} seconds...")
+        print("   Press Ctrl+C to stop")
+        if _stop.wait(config.CHECK_INTERVAL):
+            break
     
+    # Deliver alerts still queued for Slack before the process exits
+    alert_manager.close()
     logger.info("Monitoring stopped.")
 
 
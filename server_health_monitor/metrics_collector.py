@@ -0,0 +1,478 @@
+"""
+Metrics collection module
+Collects system metrics using Python
+"""
+
+import asyncio
+import subprocess
+import logging
+import math
+import os
+import socket
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Any, Iterable, List, Optional, Sequence, Tuple
+
+from server_health_monitor.timestamps import utc_iso_micro
+
+logger = logging.getLogger(__name__)
+
+
+# Seconds before the cached IP address is looked up again
+IP_CACHE_TTL = 900
+
+# Minimum seconds between the two /proc/stat samples behind a CPU reading
+CPU_MIN_WINDOW = 0.1
+
+# /proc files read each cycle: name -> (path, bytes needed)
+_PROC_FILES = {
+    'stat': ('/proc/stat', 4096),
+    'meminfo': ('/proc/meminfo', 4096),
+    'loadavg': ('/proc/loadavg', 128),
+}
+
+# Fixed /proc layouts, so the parse plan is built once here
+# /proc/stat: cpu user nice system idle iowait irq softirq steal guest guest_nice
+_CPU_FIELDS = slice(1, 9)  # guest time is already counted in user/nice
+_CPU_IDLE, _CPU_IOWAIT = 3, 4
+# /proc/meminfo: MemTotal, MemFree and MemAvailable are the first three lines
+_MEM_TOTAL = b'MemTotal:'
+_MEM_AVAILABLE = b'MemAvailable:'
+_MEM_AVAILABLE_LINE = 2
+_MEM_STRIP = b' kB'  # bytes deleted from "MemTotal:   16303912 kB"
+# /proc/loadavg: 1, 5 and 15 minute averages are the first three fields
+_LOAD_FIELDS = (('load_1min', 0), ('load_5min', 1), ('load_15min', 2))
+_GIB = 1024 ** 3
+
+
+def _int_or(default: int, value: bytes) -> int:
+    """int(value) if value is all digits, else default"""
+    return int(value) if value.isdigit() else default
+
+
+def _float_or(default: float, value: bytes) -> float:
+    """float(value) if value looks like 1.23, else default"""
+    return float(value) if value.replace(b'.', b'', 1).isdigit() else default
+
+
+def _parse_cpu_times(stat: bytes) -> Optional[Tuple[int, int]]:
+    """(idle, total) jiffies from the aggregate cpu line of /proc/stat"""
+    parts = stat.split(b'\n', 1)[0].split()
+    if len(parts) < _CPU_FIELDS.stop or parts[0] != b'cpu':
+        return None
+    
+    fields = [_int_or(0, v) for v in parts[_CPU_FIELDS]]
+    return fields[_CPU_IDLE] + fields[_CPU_IOWAIT], sum(fields)
+
+
+@dataclass
+class Metrics:
+    """One collection cycle's results"""
+    
+    __slots__ = (
+        'hostname', 'ip_address', 'timestamp',
+        'cpu_usage', 'memory_usage', 'memory_details',
+        'disk_usage', 'disk_details',
+        'load_average', 'uptime', 'process_count',
+    )
+    
+    hostname: str
+    ip_address: str
+    timestamp: str
+    cpu_usage: float
+    memory_usage: float
+    memory_details: Dict[str, Any]
+    disk_usage: float
+    disk_details: Dict[str, Any]
+    load_average: Dict[str, float]
+    uptime: str
+    process_count: int
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-ready form: host fields plus a nested 'metrics' dict"""
+        return {
+            'hostname': self.hostname,
+            'ip_address': self.ip_address,
+            'timestamp': self.timestamp,
+            'metrics': self.metrics_dict()
+        }
+    
+    def metrics_dict(self) -> Dict[str, Any]:
+        """The measured values only"""
+        return {
+            'cpu_usage': self.cpu_usage,
+            'memory_usage': self.memory_usage,
+            'memory_details': self.memory_details,
+            'disk_usage': self.disk_usage,
+            'disk_details': self.disk_details,
+            'load_average': self.load_average,
+            'uptime': self.uptime,
+            'process_count': self.process_count
+        }
+
+
+def _cpu_percent(previous: Optional[Tuple[int, int]],
+                 sample: Optional[Tuple[int, int]]) -> Optional[float]:
+    """Busy percentage between two (idle, total) samples, None if undefined"""
+    if sample is None or previous is None:
+        return None
+    
+    delta_total = sample[1] - previous[1]
+    if delta_total <= 0:
+        return None
+    return round(100 * (1 - (sample[0] - previous[0]) / delta_total), 1)
+
+
+def _read_boot_time(path: str) -> float:
+    """Boot time (epoch seconds) from the btime line of a root's /proc/stat"""
+    with open(path, 'rb') as f:
+        for line in f:
+            if line.startswith(b'btime '):
+                return float(line.split()[1])
+    raise ValueError("btime not found in /proc/stat")
+
+
+def _format_uptime(seconds: int) -> str:
+    """Format seconds like `uptime -p`, e.g. 'up 2 days, 3 hours, 5 minutes'"""
+    minutes = seconds // 60
+    parts = []
+    for name, size in (('week', 10080), ('day', 1440), ('hour', 60), ('minute', 1)):
+        count, minutes = divmod(minutes, size)
+        if count:
+            parts.append(f"{count} {name}{'s' if count != 1 else ''}")
+    return 'up ' + (', '.join(parts) or '0 minutes')
+
+
+class MetricsCollector:
+    """Collects system metrics"""
+    
+    def __init__(self):
+        self.hostname = self._get_hostname()
+        self._ip_address = self._get_ip()
+        self._ip_expiry = time.monotonic() + IP_CACHE_TTL
+        # CPU usage is the delta from the previous sample; the API's waitress
+        # threads share one collector, so the sample state is locked
+        self._cpu_lock = threading.Lock()
+        self._prev_cpu: Optional[Tuple[int, int]] = None
+        self._prev_cpu_time = 0.0
+        self._last_cpu = 0.0
+        self._inflight: Optional[asyncio.Future] = None
+        # Kept open across cycles; pread at offset 0 returns fresh contents
+        self._fds = {
+            name: os.open(path, os.O_RDONLY)
+            for name, (path, _) in _PROC_FILES.items()
+        }
+        self._proc_dir_fd = os.open('/proc', os.O_RDONLY | os.O_DIRECTORY)
+    
+    def close(self):
+        """Release the open /proc file descriptors"""
+        fds, self._fds = self._fds, {}
+        for fd in fds.values():
+            os.close(fd)
+        if self._proc_dir_fd is not None:
+            os.close(self._proc_dir_fd)
+            self._proc_dir_fd = None
+    
+    def _run_command(self, argv: List[str]) -> str:
+        """Run command (no shell) and return output"""
+        try:
+            result = subprocess.run(
+                argv,
+                capture_output=True,
+                text=True,
+                timeout=30
+            )
+            return result.stdout.strip()
+        except (OSError, subprocess.SubprocessError) as e:
+            logger.error(f"Command failed: {e}")
+            return ""
+    
+    def _get_hostname(self) -> str:
+        """Get system hostname"""
+        return socket.gethostname() or "unknown"
+    
+    def _get_ip(self) -> str:
+        """Get IP address of the interface used for outbound traffic"""
+        try:
+            # connect() on a UDP socket only selects a route; nothing is sent
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+                s.connect(('8.8.8.8', 80))
+                return s.getsockname()[0]
+        except OSError:
+            pass
+        
+        try:
+            return socket.getaddrinfo(self.hostname, None)[0][4][0]
+        except OSError:
+            return "unknown"
+    
+    @property
+    def ip_address(self) -> str:
+        """IP address, refreshed every IP_CACHE_TTL seconds"""
+        now = time.monotonic()
+        if now >= self._ip_expiry:
+            self._ip_address = self._get_ip()
+            self._ip_expiry = now + IP_CACHE_TTL
+        return self._ip_address
+    
+    def _read_proc(self, name: str) -> bytes:
+        """Read one file listed in _PROC_FILES with a single pread"""
+        try:
+            return os.pread(self._fds[name], _PROC_FILES[name][1], 0)
+        except (OSError, KeyError) as e:
+            logger.error(f"Read error for {name}: {e}")
+            return b''
+    
+    def _read_proc_batch(self, names: Iterable[str]) -> Dict[str, bytes]:
+        """Read several /proc files in one pass"""
+        return {name: self._read_proc(name) for name in names}
+    
+    def get_cpu_usage(self, stat: Optional[bytes] = None) -> float:
+        """Get CPU usage percentage since the previous sample
+        
+        Calls less than CPU_MIN_WINDOW after the previous sample return the
+        last reading instead of a percentage over a few jiffies.
+        """
+        with self._cpu_lock:
+            if self._prev_cpu is None:
+                self._prev_cpu = _parse_cpu_times(self._read_proc('stat') if stat is None else stat)
+                self._prev_cpu_time = time.monotonic()
+                time.sleep(CPU_MIN_WINDOW)
+                stat = None
+            
+            now = time.monotonic()
+            if now - self._prev_cpu_time < CPU_MIN_WINDOW:
+                return self._last_cpu
+            
+            sample = _parse_cpu_times(self._read_proc('stat') if stat is None else stat)
+            percent = _cpu_percent(self._prev_cpu, sample)
+            if sample is not None:
+                self._prev_cpu, self._prev_cpu_time = sample, now
+            if percent is not None:
+                self._last_cpu = percent
+            return self._last_cpu
+    
+    def get_memory_usage(self, meminfo: Optional[bytes] = None) -> Dict[str, Any]:
+        """Get memory usage"""
+        if meminfo is None:
+            meminfo = self._read_proc('meminfo')
+        lines = meminfo.split(b'\n', _MEM_AVAILABLE_LINE + 1)
+        if (len(lines) <= _MEM_AVAILABLE_LINE or not lines[0].startswith(_MEM_TOTAL)
+                or not lines[_MEM_AVAILABLE_LINE].startswith(_MEM_AVAILABLE)):
+            logger.error("Memory error: unexpected /proc/meminfo layout")
+            return {'usage_percent': 0}
+        
+        total_kb = lines[0][len(_MEM_TOTAL):]
+        available_kb = lines[_MEM_AVAILABLE_LINE][len(_MEM_AVAILABLE):]
+        total = _int_or(0, total_kb.translate(None, _MEM_STRIP)) // 1024
+        available = _int_or(0, available_kb.translate(None, _MEM_STRIP)) // 1024
+        used = total - available
+        percent = round((used / total) * 100, 1) if total > 0 else 0
+        
+        return {
+            'total_mb': total,
+            'used_mb': used,
+            'free_mb': total - used,
+            'usage_percent': percent
+        }
+    
+    def get_disk_usage(self, path: str = '/') -> Dict[str, Any]:
+        """Get disk usage"""
+        try:
+            st = os.statvfs(path)
+        except OSError as e:
+            logger.error(f"Disk error: {e}")
+            return {'usage_percent': 0}
+        
+        total = st.f_blocks * st.f_frsize
+        used = (st.f_blocks - st.f_bfree) * st.f_frsize
+        available = st.f_bavail * st.f_frsize
+        # Same rounding as df: percent of space usable by non-root users
+        percent = math.ceil(used * 100 / (used + available)) if used + available else 0
+        # df -BG rounds sizes up to whole GiB
+        total_gb = -(-total // _GIB)
+        used_gb = -(-used // _GIB)
+        
+        return {
+            'total_gb': total_gb,
+            'used_gb': used_gb,
+            'free_gb': total_gb - used_gb,
+            'usage_percent': percent
+        }
+    
+    def get_load_average(self, loadavg: Optional[bytes] = None) -> Dict[str, float]:
+        """Get system load average"""
+        if loadavg is None:
+            loadavg = self._read_proc('loadavg')
+        parts = loadavg.split()
+        if len(parts) < len(_LOAD_FIELDS):
+            return {key: 0 for key, _ in _LOAD_FIELDS}
+        
+        return {key: _float_or(0, parts[index]) for key, index in _LOAD_FIELDS}
+    
+    def get_uptime(self) -> str:
+        """Get system uptime"""
+        # CLOCK_BOOTTIME is what /proc/uptime reports, without the file read;
+        # unlike now - btime it is not shifted by wall clock steps
+        return _format_uptime(int(time.clock_gettime(time.CLOCK_BOOTTIME)))
+    
+    def get_process_count(self, proc_dir=None) -> int:
+        """Get running process count"""
+        if proc_dir is None:
+            proc_dir = self._proc_dir_fd
+            if proc_dir is None:  # closed; listdir(None) would list the cwd
+                return 0
+        try:
+            # One getdents64 walk of the already-open /proc directory;
+            # each process is a directory named by its PID
+            entries = os.listdir(proc_dir)
+            return sum(1 for name in entries if name[0].isdigit())
+        except OSError:
+            return 0
+    
+    def check_service(self, service_name: str) -> str:
+        """Check if service is running"""
+        return self.check_services([service_name])[service_name]
+    
+    def check_services(self, services: Sequence[str]) -> Dict[str, str]:
+        """Check multiple services with a single systemctl call"""
+        if not services:
+            return {}
+        
+        output = self._run_command(['systemctl', 'is-active', *services])
+        statuses = output.splitlines()
+        
+        # systemctl prints one status per unit, in argument order
+        statuses += ['unknown'] * (len(services) - len(statuses))
+        return dict(zip(services, statuses))
+    
+    def collect_all(self) -> Metrics:
+        """Collect all metrics"""
+        proc = self._read_proc_batch(_PROC_FILES)
+        memory = self.get_memory_usage(proc['meminfo'])
+        disk = self.get_disk_usage()
+        
+        return Metrics(
+            hostname=self.hostname,
+            ip_address=self.ip_address,
+            timestamp=utc_iso_micro(),
+            cpu_usage=self.get_cpu_usage(proc['stat']),
+            memory_usage=memory.get('usage_percent', 0),
+            memory_details=memory,
+            disk_usage=disk.get('usage_percent', 0),
+            disk_details=disk,
+            load_average=self.get_load_average(proc['loadavg']),
+            uptime=self.get_uptime(),
+            process_count=self.get_process_count()
+        )
+    
+    def _read_root_batch(self, root: str,
+                         names: Iterable[str] = _PROC_FILES) -> Dict[str, bytes]:
+        """Read _PROC_FILES entries of another root (e.g. a container's rootfs)"""
+        contents = {}
+        for name in names:
+            path, size = _PROC_FILES[name]
+            try:
+                fd = os.open(root.rstrip('/') + path, os.O_RDONLY)
+                try:
+                    contents[name] = os.pread(fd, size, 0)
+                finally:
+                    os.close(fd)
+            except OSError as e:
+                logger.error(f"Read error for {root}{path}: {e}")
+                contents[name] = b''
+        return contents
+    
+    def collect_many(self, roots: Sequence[str]) -> List[Metrics]:
+        """Collect metrics for several root filesystems, in the given order
+        
+        Each root is a directory with its own proc mount, e.g. a container's
+        rootfs or a host mounted over sshfs. The first CPU sample is taken
+        for every root before a single shared sleep, so N targets wait once
+        instead of N times.
+        """
+        if not roots:
+            return []
+        
+        first = [_parse_cpu_times(self._read_root_batch(root, ('stat',))['stat'])
+                 for root in roots]
+        time.sleep(CPU_MIN_WINDOW)
+        
+        results = []
+        for root, previous in zip(roots, first):
+            base = root.rstrip('/')
+            proc = self._read_root_batch(root)
+            memory = self.get_memory_usage(proc['meminfo'])
+            disk = self.get_disk_usage(root)
+            try:
+                with open(base + '/proc/sys/kernel/hostname') as f:
+                    hostname = f.read().strip() or "unknown"
+            except OSError as e:
+                logger.error(f"Hostname error for {root}: {e}")
+                hostname = "unknown"
+            try:
+                uptime = _format_uptime(int(time.time() - _read_boot_time(base + '/proc/stat')))
+            except (OSError, ValueError) as e:
+                logger.error(f"Uptime error for {root}: {e}")
+                uptime = "unknown"
+            
+            results.append(Metrics(
+                hostname=hostname,
+                ip_address=self.ip_address if base == '' else "unknown",
+                timestamp=utc_iso_micro(),
+                cpu_usage=_cpu_percent(previous, _parse_cpu_times(proc['stat'])) or 0.0,
+                memory_usage=memory.get('usage_percent', 0),
+                memory_details=memory,
+                disk_usage=disk.get('usage_percent', 0),
+                disk_details=disk,
+                load_average=self.get_load_average(proc['loadavg']),
+                uptime=uptime,
+                process_count=self.get_process_count(base + '/proc')
+            ))
+        return results
+    
+    async def collect_all_async(self) -> Metrics:
+        """Collect all metrics off the event loop
+        
+        Callers that arrive while a collection is running share its result
+        instead of starting another one, so N concurrent awaiters cost one
+        batch of /proc reads. Treat the returned Metrics as read-only.
+        """
+        if self._inflight is None:
+            loop = asyncio.get_running_loop()
+            self._inflight = loop.run_in_executor(None, self.collect_all)
+            self._inflight.add_done_callback(self._clear_inflight)
+        return await asyncio.shield(self._inflight)
+    
+    def _clear_inflight(self, _future: asyncio.Future):
+        """Allow the next collect_all_async call to start a new collection"""
+        self._inflight = None
+
+
+# Test
+if __name__ == '__main__':
+    try:
+        import orjson
+    except ImportError:
+        orjson = None
+    import json
+    
+    collector = MetricsCollector()
+    
+    print("Testing Metrics Collector...")
+    print(f"Hostname: {collector.hostname}")
+    print(f"CPU: {collector.get_cpu_usage()}%")
+    print(f"Memory: {collector.get_memory_usage()}")
+    print(f"Disk: {collector.get_disk_usage()}")
+    print(f"Load: {collector.get_load_average()}")
+    print(f"Uptime: {collector.get_uptime()}")
+    
+    print("\nAll metrics:")
+    all_metrics = collector.collect_all()
+    if orjson is not None:
+        print(orjson.dumps(all_metrics.to_dict(), option=orjson.OPT_INDENT_2).decode())
+    else:
+        print(json.dumps(all_metrics.to_dict(), indent=2))
+    
+    print("\n✅ Metrics collector test passed!")
\ No newline at end of file
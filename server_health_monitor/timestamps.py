@@ -0,0 +1,36 @@
+"""
+Timestamp helpers - formatted strings cached per second
+"""
+
+import time
+from typing import Tuple
+
+_last_utc: Tuple[int, str] = (0, '')
+_last_local: Tuple[int, str] = (0, '')
+
+
+def utc_iso() -> str:
+    """Current UTC time as ISO 8601, e.g. 2024-01-01T12:00:00"""
+    global _last_utc
+    now = int(time.time())
+    if _last_utc[0] != now:
+        _last_utc = (now, time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(now)))
+    return _last_utc[1]
+
+
+def utc_iso_micro() -> str:
+    """Current UTC time with microseconds, e.g. 2024-01-01T12:00:00.123456Z"""
+    global _last_utc
+    seconds, ns = divmod(time.time_ns(), 1_000_000_000)
+    if _last_utc[0] != seconds:
+        _last_utc = (seconds, time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(seconds)))
+    return f"{_last_utc[1]}.{ns // 1000:06d}Z"
+
+
+def local_time() -> str:
+    """Current local time, e.g. 2024-01-01 12:00:00"""
+    global _last_local
+    now = int(time.time())
+    if _last_local[0] != now:
+        _last_local = (now, time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(now)))
+    return _last_local[1]